@@ -9,12 +9,249 @@ Usage:
 """
 
 import json
+import os
 import re
+import shutil
+import tempfile
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
+
+
+# Precompiled patterns shared by every agent conversion
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_TOOL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'use.*?`(\w+)`.*?tool',
+        r'tool.*?`(\w+)`',
+        r'@(\w+)',
+        r'mcp.*?(\w+)',
+    )
+]
+_BUILTIN_TOOLS = ('read', 'write', 'shell', 'grep', 'list_dir')
+
+# MCP servers inferred from keywords in the agent content
+_MCP_CONFIGS = {
+    'github': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-github']},
+    'gitlab': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-gitlab']},
+    'aws': {'command': 'npx', 'args': ['-y', '@aws/mcp-server']},
+    'kubernetes': {'command': 'npx', 'args': ['-y', '@kubernetes/mcp-server']},
+    'postgres': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-postgres']},
+    'slack': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-slack']},
+    'filesystem': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-filesystem']},
+    'brave-search': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-brave-search']},
+    'memory': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-memory']},
+    'everything': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-everything']},
+}
+
+# The index only needs two string fields, so skip a full JSON parse. These
+# match top-level keys in the indent=2 layout this converter writes: nested
+# keys are indented further and JSON strings cannot span lines. Files in any
+# other layout fall back to json.loads.
+_JSON_NAME_RE = re.compile(rb'^  "name": ("(?:[^"\\]|\\.)*")', re.MULTILINE)
+_JSON_DESCRIPTION_RE = re.compile(rb'^  "description": ("(?:[^"\\]|\\.)*")', re.MULTILINE)
+
+# Below this many agents the process pool costs more than it saves
+_PARALLEL_MIN_FILES = 8
+_PARALLEL_CHUNKSIZE = 16
+
+# The index is written as many short lines; a larger buffer batches them
+# into fewer write syscalls
+_WRITE_BUFFER_SIZE = 65536
+
+
+def read_text_file(path: Path) -> str:
+    """Read a UTF-8 file with the same newline handling as text mode."""
+    text = path.read_bytes().decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# Agent name keywords in priority order, mapped to an allowedTools bucket
+_TOOL_BUCKETS = {
+    'architect': 'read_only', 'design': 'read_only',
+    'review': 'read_only', 'audit': 'read_only',
+    'security': 'security', 'scanner': 'security',
+    'dev': 'developer', 'engineer': 'developer',
+    'devops': 'infrastructure', 'infrastructure': 'infrastructure',
+}
+
+# Safe read-only tools
+_SAFE_TOOLS = ['read', 'list_dir', 'grep', 'introspect']
+
+_BUCKET_TOOLS = {
+    'read_only': _SAFE_TOOLS,
+    'security': _SAFE_TOOLS,
+    'developer': ['read', 'write', 'list_dir', 'shell'],
+    'infrastructure': ['read', 'write', 'shell'],
+}
+
+# Agent name keywords in priority order, mapped to an index category
+_INDEX_CATEGORIES = {
+    'architect': 'Architecture', 'design': 'Architecture',
+    'dev': 'Development', 'engineer': 'Development',
+    'devops': 'Infrastructure', 'infra': 'Infrastructure',
+    'security': 'Security', 'audit': 'Security',
+    'review': 'Quality Assurance',
+}
+
+
+def compile_keyword_table(table: Dict[str, str]) -> re.Pattern:
+    """Compile the keys of a keyword table into one pattern.
+    
+    The lookahead reports every occurrence, including overlapping ones, so
+    the caller can pick the keyword that comes first in the table.
+    """
+    alternation = '|'.join(re.escape(keyword) for keyword in table)
+    return re.compile(f'(?=({alternation}))')
+
+
+def match_keyword_table(text: str, pattern: re.Pattern, table: Dict[str, str],
+                        priority: Dict[str, int]) -> Optional[str]:
+    """Return the value of the highest-priority table keyword found in text."""
+    found = pattern.findall(text)
+    if not found:
+        return None
+    return table[min(found, key=priority.__getitem__)]
+
+
+# Pattern and keyword -> position in table, built once per table
+_TOOL_BUCKET_RE = compile_keyword_table(_TOOL_BUCKETS)
+_TOOL_BUCKET_PRIORITY = {keyword: i for i, keyword in enumerate(_TOOL_BUCKETS)}
+_INDEX_CATEGORY_RE = compile_keyword_table(_INDEX_CATEGORIES)
+_INDEX_CATEGORY_PRIORITY = {keyword: i for i, keyword in enumerate(_INDEX_CATEGORIES)}
+
+
+# Classification depends only on the agent name, which repeats across
+# plugin directories and runs, so the results are memoized
+@lru_cache(maxsize=4096)
+def agent_tool_bucket(agent_name: str) -> Optional[str]:
+    """Return the allowedTools bucket for an agent name, if any."""
+    return match_keyword_table(
+        agent_name.lower(), _TOOL_BUCKET_RE, _TOOL_BUCKETS, _TOOL_BUCKET_PRIORITY
+    )
+
+
+@lru_cache(maxsize=4096)
+def agent_index_category(agent_name: str) -> str:
+    """Return the agents_index.md category for an agent name."""
+    return match_keyword_table(
+        agent_name.lower(), _INDEX_CATEGORY_RE, _INDEX_CATEGORIES, _INDEX_CATEGORY_PRIORITY
+    ) or "General"
+
+
+def dumps_agent_json(data: Dict[str, Any]) -> bytes:
+    """Serialize an agent config as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# Top-level "key: value" line of a flat frontmatter mapping
+_YAML_ENTRY_RE = re.compile(r'^([A-Za-z_][\w-]*):(?:[ \t]+(.*?))?[ \t]*$')
+# Plain scalars that YAML would resolve to something other than a string
+_YAML_SPECIAL_WORDS = frozenset({
+    'yes', 'no', 'true', 'false', 'on', 'off', 'null', 'y', 'n',
+})
+
+
+def _parse_yaml_scalar(value: str) -> Optional[str]:
+    """Return the string a simple YAML scalar denotes, or None if it needs a real parser."""
+    if not value:
+        return None
+    first = value[0]
+    if first == '"':
+        inner = value[1:-1]
+        if len(value) > 1 and value[-1] == '"' and '"' not in inner and '\\' not in inner:
+            return inner
+        return None
+    if first == "'":
+        inner = value[1:-1]
+        if len(value) > 1 and value[-1] == "'" and "'" not in inner:
+            return inner
+        return None
+    # Only plain strings starting with a letter are safe; numbers, dates and
+    # indicators such as [ { | > & * ! all go to PyYAML
+    if not first.isalpha() or value.lower() in _YAML_SPECIAL_WORDS:
+        return None
+    if ': ' in value or ' #' in value or '\t' in value or value.endswith(':'):
+        return None
+    return value
+
+
+def load_yaml(yaml_str: str) -> Any:
+    """Safe-load YAML, using the libyaml C loader when PyYAML provides it."""
+    return yaml.load(yaml_str, Loader=_YamlLoader)
+
+
+def parse_yaml_frontmatter(yaml_str: str) -> Optional[Dict]:
+    """Parse agent frontmatter, handling flat string entries without PyYAML.
+    
+    Entries with nested blocks, lists or non-string scalars are collected and
+    handed to load_yaml() together. Anything outside the simple
+    "key: value" shape (including repeated keys) makes the whole block go
+    through PyYAML, so malformed frontmatter still raises yaml.YAMLError.
+    """
+    if '\r' in yaml_str:
+        return load_yaml(yaml_str)
+    
+    result = {}
+    complex_lines = []
+    seen_keys = set()
+    in_complex_entry = False
+    
+    for line in yaml_str.split('\n'):
+        if not line.strip() or line.lstrip().startswith('#'):
+            if in_complex_entry:
+                complex_lines.append(line)
+            continue
+        if line[0] in ' \t':
+            if not in_complex_entry:
+                return load_yaml(yaml_str)
+            complex_lines.append(line)
+            continue
+        
+        match = _YAML_ENTRY_RE.match(line)
+        if not match or match.group(1) in seen_keys:
+            return load_yaml(yaml_str)
+        seen_keys.add(match.group(1))
+        
+        value = _parse_yaml_scalar(match.group(2) or '')
+        if value is None:
+            in_complex_entry = True
+            complex_lines.append(line)
+        else:
+            in_complex_entry = False
+            result[match.group(1)] = value
+    
+    if complex_lines:
+        # Keep the line break that followed the entries in the original
+        # block so block scalars are clipped the same way
+        complex_yaml = '\n'.join(complex_lines)
+        if not in_complex_entry:
+            complex_yaml += '\n'
+        nested = load_yaml(complex_yaml)
+        if not isinstance(nested, dict):
+            return load_yaml(yaml_str)
+        result.update(nested)
+    
+    return result or None
+
 
 class ClaudeToKiroConverter:
     """Converts Claude Code agents to Kiro CLI format."""
@@ -67,74 +304,58 @@ class ClaudeToKiroConverter:
     
     def parse_frontmatter(self, content: str) -> tuple[Optional[Dict], str]:
         """Extract YAML frontmatter from markdown."""
-        frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         
         if match:
             try:
-                frontmatter = yaml.safe_load(match.group(1))
+                frontmatter = parse_yaml_frontmatter(match.group(1))
                 body = match.group(2)
                 return frontmatter, body
             except yaml.YAMLError:
                 return None, content
         return None, content
     
-    def extract_tools_from_content(self, content: str) -> List[str]:
+    def extract_tools_from_content(self, content: str, content_lower: Optional[str] = None) -> List[str]:
         """Extract tool mentions from agent content."""
+        if content_lower is None:
+            content_lower = content.lower()
         tools = set()
         
         # Common tool patterns
-        tool_patterns = [
-            r'use.*?`(\w+)`.*?tool',
-            r'tool.*?`(\w+)`',
-            r'@(\w+)',
-            r'mcp.*?(\w+)',
-        ]
-        
-        for pattern in tool_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            tools.update(matches)
+        for pattern in _TOOL_PATTERNS:
+            tools.update(pattern.findall(content))
         
         # Built-in Kiro tools
-        builtin_tools = ['read', 'write', 'shell', 'grep', 'list_dir']
-        for tool in builtin_tools:
-            if tool in content.lower():
-                tools.add(tool)
+        tools.update(tool for tool in _BUILTIN_TOOLS if tool in content_lower)
         
         return list(tools)
     
-    def infer_allowed_tools(self, agent_type: str, content: str) -> List[str]:
+    def infer_allowed_tools(self, agent_type: str, content: str, content_lower: Optional[str] = None) -> List[str]:
         """Infer which tools should be auto-approved based on agent type."""
-        allowed = []
-        
-        # Safe read-only tools
-        safe_tools = ['read', 'list_dir', 'grep', 'introspect']
-        
-        type_lower = agent_type.lower()
-        content_lower = content.lower()
+        if content_lower is None:
+            content_lower = content.lower()
+        allowed = set()
         
         # Type-based permissions
-        if 'architect' in type_lower or 'design' in type_lower:
-            allowed.extend(safe_tools)
-        elif 'review' in type_lower or 'audit' in type_lower:
-            allowed.extend(safe_tools)
-        elif 'security' in type_lower or 'scanner' in type_lower:
-            allowed.extend(safe_tools)
+        bucket = agent_tool_bucket(agent_type)
+        allowed.update(_BUCKET_TOOLS.get(bucket, []))
+        
+        if bucket == 'security':
             if 'scan' in content_lower:
-                allowed.append('@security-scanner/*')
-        elif 'dev' in type_lower or 'engineer' in type_lower:
-            allowed.extend(['read', 'write', 'list_dir', 'shell'])
-        elif 'devops' in type_lower or 'infrastructure' in type_lower:
-            allowed.extend(['read', 'write', 'shell'])
+                allowed.add('@security-scanner/*')
+        elif bucket == 'infrastructure':
             if 'aws' in content_lower:
-                allowed.append('@aws/*')
+                allowed.add('@aws/*')
             if 'kubernetes' in content_lower or 'k8s' in content_lower:
-                allowed.append('@kubernetes/*')
+                allowed.add('@kubernetes/*')
         
-        return list(set(allowed))
+        return sorted(allowed)
     
-    def extract_mcp_servers(self, content: str, frontmatter: Optional[Dict]) -> Dict[str, Any]:
+    def extract_mcp_servers(self, content: str, frontmatter: Optional[Dict],
+                            content_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract MCP server configurations, filtered by allowed list."""
+        if content_lower is None:
+            content_lower = content.lower()
         mcps = {}
         
         # Check frontmatter
@@ -144,132 +365,174 @@ class ClaudeToKiroConverter:
                     mcps[server_name] = config
         
         # Infer from content
-        mcp_keywords = {
-            'github': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-github']},
-            'gitlab': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-gitlab']},
-            'aws': {'command': 'npx', 'args': ['-y', '@aws/mcp-server']},
-            'kubernetes': {'command': 'npx', 'args': ['-y', '@kubernetes/mcp-server']},
-            'postgres': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-postgres']},
-            'slack': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-slack']},
-            'filesystem': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-filesystem']},
-            'brave-search': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-brave-search']},
-            'memory': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-memory']},
-            'everything': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-everything']},
-        }
-        
-        content_lower = content.lower()
-        for keyword, config in mcp_keywords.items():
+        for keyword, config in _MCP_CONFIGS.items():
             if keyword in content_lower and keyword not in mcps and keyword in self.allowed_mcps:
                 mcps[keyword] = config
         
         return mcps
     
-    def extract_mcp_servers_unfiltered(self, content: str, frontmatter: Optional[Dict]) -> Dict[str, Any]:
+    def extract_mcp_servers_unfiltered(self, content: str, frontmatter: Optional[Dict],
+                                       content_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract all MCP servers without filtering (for comparison)."""
+        if content_lower is None:
+            content_lower = content.lower()
         mcps = {}
         
         if frontmatter and 'mcpServers' in frontmatter:
             mcps.update(frontmatter['mcpServers'])
         
-        mcp_keywords = {
-            'github': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-github']},
-            'gitlab': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-gitlab']},
-            'aws': {'command': 'npx', 'args': ['-y', '@aws/mcp-server']},
-            'kubernetes': {'command': 'npx', 'args': ['-y', '@kubernetes/mcp-server']},
-            'postgres': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-postgres']},
-            'slack': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-slack']},
-            'filesystem': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-filesystem']},
-            'brave-search': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-brave-search']},
-            'memory': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-memory']},
-            'everything': {'command': 'npx', 'args': ['-y', '@modelcontextprotocol/server-everything']},
-        }
-        
-        content_lower = content.lower()
-        for keyword, config in mcp_keywords.items():
+        for keyword, config in _MCP_CONFIGS.items():
             if keyword in content_lower and keyword not in mcps:
                 mcps[keyword] = config
         
         return mcps
     
-    def convert_agent(self, agent_path: Path) -> Optional[Dict[str, Any]]:
-        """Convert a single Claude Code agent to Kiro format."""
+    def convert_agent(self, agent_path: Path, content: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Convert a single Claude Code agent to Kiro format.
+        
+        Pass content when the caller has already read the file.
+        """
         try:
-            content = agent_path.read_text()
+            if content is None:
+                content = read_text_file(agent_path)
             frontmatter, body = self.parse_frontmatter(content)
-            
-            # Extract name from filename
-            agent_name = agent_path.stem
-            
-            # Build Kiro agent config
-            kiro_agent = {
-                "name": agent_name,
-                "description": "",
-                "prompt": self.filter_text_by_keywords(body.strip()),
-                "tools": ["*"],  # Start with all tools
-                "allowedTools": [],
-                "mcpServers": {},
-                "resources": []
-            }
-            
-            # Extract from frontmatter if available
-            if frontmatter:
-                description = frontmatter.get('description', '')
-                kiro_agent["description"] = self.filter_text_by_keywords(description)
-                
-                # Map Claude Code fields to Kiro
-                if 'model' in frontmatter:
-                    kiro_agent["model"] = frontmatter['model']
-                
-                if 'temperature' in frontmatter:
-                    kiro_agent["temperature"] = frontmatter['temperature']
-                
-                if 'tools' in frontmatter:
-                    kiro_agent["tools"] = frontmatter['tools']
-            
-            # If no description in frontmatter, extract from content
-            if not kiro_agent["description"]:
-                # Try to get first line or paragraph as description
-                first_para = body.strip().split('\n\n')[0]
-                if len(first_para) < 200:
-                    filtered_desc = self.filter_text_by_keywords(first_para.strip('#').strip())
-                    kiro_agent["description"] = filtered_desc
-            
-            # Extract and configure tools
-            mentioned_tools = self.extract_tools_from_content(content)
-            if mentioned_tools:
-                kiro_agent["tools"].extend([f"@{t}" for t in mentioned_tools])
-                kiro_agent["tools"] = list(set(kiro_agent["tools"]))
-            
-            # Infer allowed tools
-            kiro_agent["allowedTools"] = self.infer_allowed_tools(
-                agent_name, 
-                content
-            )
-            
-            # Extract MCP servers
-            kiro_agent["mcpServers"] = self.extract_mcp_servers(content, frontmatter)
-            
-            return kiro_agent
-            
+            return self.build_kiro_agent(agent_path, content, content.lower(), frontmatter, body)
         except Exception as e:
             print(f"Error converting {agent_path}: {e}")
             return None
     
+    def build_kiro_agent(self, agent_path: Path, content: str, content_lower: str,
+                         frontmatter: Optional[Dict], body: str) -> Dict[str, Any]:
+        """Build the Kiro config for an agent, raising on malformed input.
+        
+        Takes the lowercased content and parsed frontmatter from the caller so
+        they can be reused after the agent is built.
+        """
+        # Extract name from filename
+        agent_name = agent_path.stem
+        
+        # Tools are collected as a set and sorted once at the end
+        tools = {"*"}  # Start with all tools
+        
+        # Build Kiro agent config
+        kiro_agent = {
+            "name": agent_name,
+            "description": "",
+            "prompt": self.filter_text_by_keywords(body.strip()),
+            "tools": [],
+            "allowedTools": [],
+            "mcpServers": {},
+            "resources": []
+        }
+        
+        # Extract from frontmatter if available
+        if frontmatter:
+            description = frontmatter.get('description', '')
+            kiro_agent["description"] = self.filter_text_by_keywords(description)
+            
+            # Map Claude Code fields to Kiro
+            if 'model' in frontmatter:
+                kiro_agent["model"] = frontmatter['model']
+            
+            if 'temperature' in frontmatter:
+                kiro_agent["temperature"] = frontmatter['temperature']
+            
+            if 'tools' in frontmatter:
+                frontmatter_tools = frontmatter['tools']
+                if isinstance(frontmatter_tools, str):
+                    # Claude Code agents usually list tools as "Read, Grep, Bash"
+                    tools = {tool.strip() for tool in frontmatter_tools.split(',') if tool.strip()}
+                else:
+                    tools = set(frontmatter_tools)
+        
+        # If no description in frontmatter, extract from content
+        if not kiro_agent["description"]:
+            # Try to get first line or paragraph as description
+            first_para = body.strip().split('\n\n')[0]
+            if len(first_para) < 200:
+                filtered_desc = self.filter_text_by_keywords(first_para.strip('#').strip())
+                kiro_agent["description"] = filtered_desc
+        
+        # Extract and configure tools
+        mentioned_tools = self.extract_tools_from_content(content, content_lower)
+        tools.update(f"@{t}" for t in mentioned_tools)
+        kiro_agent["tools"] = sorted(tools)
+        
+        # Infer allowed tools
+        kiro_agent["allowedTools"] = self.infer_allowed_tools(
+            agent_name, 
+            content,
+            content_lower
+        )
+        
+        # Extract MCP servers
+        kiro_agent["mcpServers"] = self.extract_mcp_servers(content, frontmatter, content_lower)
+        
+        return kiro_agent
+    
     def find_agent_files(self) -> List[Path]:
         """Find all agent markdown files in the source directory."""
         agent_files = []
         
-        # Look for agents in plugins/*/agents/*.md
+        # Look for agents in plugins/*/agents/*.md. os.scandir hands back
+        # DirEntry objects whose type comes from readdir, which avoids a stat
+        # call per entry compared to iterdir()/glob()
         plugins_dir = self.source_dir / "plugins"
-        if plugins_dir.exists():
-            for plugin_dir in plugins_dir.iterdir():
-                if plugin_dir.is_dir():
-                    agents_dir = plugin_dir / "agents"
-                    if agents_dir.exists():
-                        agent_files.extend(agents_dir.glob("*.md"))
+        try:
+            with os.scandir(plugins_dir) as plugins:
+                plugin_paths = [entry.path for entry in plugins if entry.is_dir()]
+        except FileNotFoundError:
+            return agent_files
+        
+        for plugin_path in plugin_paths:
+            try:
+                with os.scandir(os.path.join(plugin_path, "agents")) as agents:
+                    agent_files.extend(
+                        Path(entry.path) for entry in agents
+                        if entry.name.endswith(".md") and entry.is_file()
+                    )
+            except (FileNotFoundError, NotADirectoryError):
+                continue
         
         return agent_files
     
+    def convert_and_save(self, agent_path: Path, dry_run: bool = False) -> Tuple[Optional[str], int, List[str]]:
+        """Convert and write a single agent.
+        
+        Returns the agent name (None on failure), the number of filtered MCP
+        servers and the progress messages to print, so that workers in a
+        process pool leave all output to the parent.
+        """
+        messages = []
+        try:
+            content = read_text_file(agent_path)
+            content_lower = content.lower()
+            frontmatter, body = self.parse_frontmatter(content)
+            kiro_agent = self.build_kiro_agent(agent_path, content, content_lower, frontmatter, body)
+        except Exception as e:
+            messages.append(f"Error converting {agent_path}: {e}")
+            messages.append(f"  ✗ Failed to convert")
+            return None, 0, messages
+        
+        # Count filtered MCPs
+        original_mcps = self.extract_mcp_servers_unfiltered(content, frontmatter, content_lower)
+        filtered_count = len(original_mcps) - len(kiro_agent['mcpServers'])
+        
+        if filtered_count > 0:
+            filtered_names = set(original_mcps.keys()) - set(kiro_agent['mcpServers'].keys())
+            messages.append(f"  ! Filtered {filtered_count} MCP server(s): {', '.join(filtered_names)}")
+        
+        output_path = self.output_dir / f"{kiro_agent['name']}.json"
+        
+        if not dry_run:
+            with open(output_path, 'wb') as f:
+                f.write(dumps_agent_json(kiro_agent))
+            messages.append(f"  ✓ Saved to {output_path}")
+        else:
+            messages.append(f"  ✓ Would save to {output_path}")
+        
+        return kiro_agent['name'], filtered_count, messages
+    
     def convert_all(self, dry_run: bool = False) -> Dict[str, Any]:
         """Convert all agents from source to output directory."""
         stats = {
@@ -287,92 +550,87 @@ class ClaudeToKiroConverter:
         print(f"Allowed MCP servers: {sorted(self.allowed_mcps)}")
         print(f"Ignore keywords: {sorted(self.ignore_keywords)}")
         
-        for agent_path in agent_files:
+        convert = partial(self.convert_and_save, dry_run=dry_run)
+        if len(agent_files) < _PARALLEL_MIN_FILES:
+            results = list(map(convert, agent_files))
+        else:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(convert, agent_files, chunksize=_PARALLEL_CHUNKSIZE))
+        
+        for agent_path, (name, filtered_count, messages) in zip(agent_files, results):
             print(f"Converting: {agent_path.name}")
+            for message in messages:
+                print(message)
             
-            kiro_agent = self.convert_agent(agent_path)
-            
-            if kiro_agent:
-                # Count filtered MCPs
-                original_mcps = self.extract_mcp_servers_unfiltered(
-                    agent_path.read_text(), 
-                    self.parse_frontmatter(agent_path.read_text())[0]
-                )
-                filtered_count = len(original_mcps) - len(kiro_agent['mcpServers'])
+            if name:
                 stats['filtered_mcps'] += filtered_count
-                
-                if filtered_count > 0:
-                    filtered_names = set(original_mcps.keys()) - set(kiro_agent['mcpServers'].keys())
-                    print(f"  ! Filtered {filtered_count} MCP server(s): {', '.join(filtered_names)}")
-                
-                output_path = self.output_dir / f"{kiro_agent['name']}.json"
-                
-                if not dry_run:
-                    with open(output_path, 'w') as f:
-                        json.dump(kiro_agent, f, indent=2)
-                    print(f"  ✓ Saved to {output_path}")
-                else:
-                    print(f"  ✓ Would save to {output_path}")
-                
                 stats['converted'] += 1
-                stats['agents'].append(kiro_agent['name'])
+                stats['agents'].append(name)
             else:
                 stats['failed'] += 1
-                print(f"  ✗ Failed to convert")
         
         return stats
     
+    @staticmethod
+    def _index_fields(agent_json: bytes, default_name: str) -> Tuple[str, str]:
+        """Return the top-level name and description of raw agent JSON."""
+        name_match = _JSON_NAME_RE.search(agent_json)
+        if name_match is None:
+            # Not written by this converter; parse it properly
+            agent_data = json.loads(agent_json)
+            return agent_data.get("name", default_name), agent_data.get("description", "")
+        
+        desc_match = _JSON_DESCRIPTION_RE.search(agent_json)
+        desc = json.loads(desc_match.group(1)) if desc_match else ""
+        return json.loads(name_match.group(1)), desc
+    
     def create_index(self) -> None:
         """Create an index file listing all converted agents."""
-        agent_files = list(self.output_dir.glob("*.json"))
-        
-        # Sort agent files by name
-        agent_files.sort(key=lambda x: x.name)
+        # Sorted by file name, so entries within each category come out in
+        # order as they are streamed to the spool files
+        agent_files = sorted(self.output_dir.glob("*.json"), key=lambda x: x.name)
         
         index_path = self.output_dir / "agents_index.md"
         
-        with open(index_path, 'w') as f:
+        with open(index_path, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write("# Available Kiro Agents\n\n")
             f.write(f"Total agents: {len(agent_files)}\n\n")
             
+            # Entries are spooled to one temporary file per category so that
+            # memory use does not grow with the number of agents
             categories = {}
             
-            for agent_file in agent_files:
-                try:
-                    with open(agent_file) as af:
-                        agent_data = json.load(af)
-                        name = agent_data.get("name", agent_file.stem)
-                        desc = agent_data.get("description", "").strip()
+            try:
+                for agent_file in agent_files:
+                    try:
+                        agent_json = agent_file.read_bytes()
+                        name, desc = self._index_fields(agent_json, agent_file.stem)
+                        desc = desc.strip()
                         if desc:
                             # Take first line only
                             desc = desc.split('\n')[0]
-                        
+                            
                         # Categorize
-                        category = "General"
-                        name_lower = name.lower()
-                        if "architect" in name_lower or "design" in name_lower:
-                            category = "Architecture"
-                        elif "dev" in name_lower or "engineer" in name_lower:
-                            category = "Development"
-                        elif "devops" in name_lower or "infra" in name_lower:
-                            category = "Infrastructure"
-                        elif "security" in name_lower or "audit" in name_lower:
-                            category = "Security"
-                        elif "review" in name_lower:
-                            category = "Quality Assurance"
+                        category = agent_index_category(name)
                             
                         if category not in categories:
-                            categories[category] = []
-                        categories[category].append((name, desc))
-                except Exception:
-                    continue
-            
-            # Write by category
-            for category in sorted(categories.keys()):
-                f.write(f"## {category}\n\n")
-                for name, desc in categories[category]:
-                    f.write(f"- **{name}**: {desc}\n")
-                f.write("\n")
+                            categories[category] = tempfile.TemporaryFile(
+                                'w+', buffering=_WRITE_BUFFER_SIZE, encoding='utf-8'
+                            )
+                        categories[category].write(f"- **{name}**: {desc}\n")
+                    except Exception:
+                        continue
+                
+                # Write by category
+                for category in sorted(categories.keys()):
+                    f.write(f"## {category}\n\n")
+                    spool = categories[category]
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, f, _WRITE_BUFFER_SIZE)
+                    f.write("\n")
+            finally:
+                for spool in categories.values():
+                    spool.close()
         
         print(f"\nCreated index at {index_path}")
 
@@ -10,6 +10,55 @@ import argparse
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import ahocorasick
+except ImportError:  # optional, falls back to a single compiled regex
+    ahocorasick = None
+
+# Technology terms recognised as keywords
+TECH_TERMS = (
+    'stripe', 'paypal', 'pci', 'gdpr', 'fastapi', 'nextjs', 'react', 'vue', 'angular',
+    'typescript', 'javascript', 'python', 'rust', 'go', 'java', 'aws', 'azure', 'gcp',
+    'docker', 'kubernetes', 'terraform', 'helm', 'istio', 'linkerd', 'prometheus',
+    'grafana', 'postgres', 'mysql', 'mongodb', 'redis', 'graphql', 'rest', 'grpc',
+    'oauth', 'jwt', 'webpack', 'tailwind', 'jest', 'cypress', 'playwright', 'gitlab',
+    'github', 'unity', 'godot', 'solidity', 'ethereum',
+)
+
+_TECH_RE = re.compile(r'\b(' + '|'.join(TECH_TERMS) + r')\b')
+
+if ahocorasick is not None:
+    _TECH_AUTOMATON = ahocorasick.Automaton()
+    for _term in TECH_TERMS:
+        _TECH_AUTOMATON.add_word(_term, _term)
+    _TECH_AUTOMATON.make_automaton()
+else:
+    _TECH_AUTOMATON = None
+
+def _is_word_char(text: str, index: int) -> bool:
+    """Whether text[index] exists and counts as a regex word character"""
+    return 0 <= index < len(text) and (text[index].isalnum() or text[index] == '_')
+
+def find_tech_terms(text: str) -> List[str]:
+    """Find whole-word technology terms in text, in order of appearance"""
+    if _TECH_AUTOMATON is None:
+        return _TECH_RE.findall(text)
+    
+    # The automaton reports every substring hit; keep only whole words to
+    # match the regex's \b boundaries
+    found = []
+    for end, term in _TECH_AUTOMATON.iter(text):
+        start = end - len(term) + 1
+        if not _is_word_char(text, start - 1) and not _is_word_char(text, end + 1):
+            found.append(term)
+    return found
+
+# Separators between words in skill names and path segments
+_SPLIT_RE = re.compile(r'[-_\s]+')
+
+# Bytes read at a time while looking for the end of SKILL.md frontmatter
+FRONTMATTER_CHUNK_SIZE = 4096
+
 # Simple YAML parser for frontmatter (avoiding external dependencies)
 def parse_yaml_frontmatter(yaml_str: str) -> Dict:
     """Simple YAML parser for basic frontmatter"""
@@ -25,13 +74,14 @@ def parse_yaml_frontmatter(yaml_str: str) -> Dict:
 def dump_yaml(data: Dict) -> str:
     """Simple YAML dumper"""
     lines = []
+    append = lines.append
+    extend = lines.extend
     for key, value in data.items():
         if isinstance(value, list):
-            lines.append(f"{key}:")
-            for item in value:
-                lines.append(f"  - \"{item}\"")
+            append(f"{key}:")
+            extend(f"  - \"{item}\"" for item in value)
         else:
-            lines.append(f"{key}: \"{value}\"")
+            append(f"{key}: \"{value}\"")
     return '\n'.join(lines)
 
 def extract_keywords(description: str, skill_name: str, skill_path: str = "") -> List[str]:
@@ -39,7 +89,7 @@ def extract_keywords(description: str, skill_name: str, skill_path: str = "") ->
     keywords = []
     
     # Extract from skill name (most specific)
-    name_parts = re.split(r'[-_\s]+', skill_name.lower())
+    name_parts = _SPLIT_RE.split(skill_name.lower())
     keywords.extend([part for part in name_parts if len(part) > 2])
     
     # Extract from path segments (plugin category)
@@ -49,7 +99,7 @@ def extract_keywords(description: str, skill_name: str, skill_path: str = "") ->
             if 'plugins' in part or 'skills' in part or 'wshobson-agents' in part:
                 continue
             # Split hyphens and underscores into separate keywords
-            sub_parts = re.split(r'[-_\s]+', part)
+            sub_parts = _SPLIT_RE.split(part)
             for sub_part in sub_parts:
                 if sub_part and len(sub_part) > 2:
                     keywords.append(sub_part)
@@ -59,7 +109,7 @@ def extract_keywords(description: str, skill_name: str, skill_path: str = "") ->
     combined = f"{skill_name} {description}".lower()
     
     # Direct technology matches
-    direct_matches = re.findall(r'\b(stripe|paypal|pci|gdpr|fastapi|nextjs|react|vue|angular|typescript|javascript|python|rust|go|java|aws|azure|gcp|docker|kubernetes|terraform|helm|istio|linkerd|prometheus|grafana|postgres|mysql|mongodb|redis|graphql|rest|grpc|oauth|jwt|webpack|tailwind|jest|cypress|playwright|gitlab|github|unity|godot|solidity|ethereum)\b', combined)
+    direct_matches = find_tech_terms(combined)
     tech_terms.extend(direct_matches)
     
     # Combine all, prioritize skill name parts
@@ -73,28 +123,39 @@ def extract_keywords(description: str, skill_name: str, skill_path: str = "") ->
     
     return unique[:4]
 
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 file bytes with the same newline handling as text mode"""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
 def parse_skill_md(file_path: Path) -> Dict:
     """Parse SKILL.md file and extract frontmatter and content"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Split frontmatter and body
-    if content.startswith('---'):
-        parts = content.split('---', 2)
-        if len(parts) >= 3:
-            frontmatter = parse_yaml_frontmatter(parts[1])
-            body = parts[2].strip()
-        else:
+    with open(file_path, 'rb') as f:
+        # Frontmatter sits at the top and is short, so look for the closing
+        # delimiter in the first chunk and read the body separately
+        head = bytearray(f.read(FRONTMATTER_CHUNK_SIZE))
+        end = head.find(b'\n---', 3) if head.startswith(b'---') else -1
+        while end == -1 and head.startswith(b'---'):
+            chunk = f.read(FRONTMATTER_CHUNK_SIZE)
+            if not chunk:
+                break
+            head += chunk
+            # Only search the new chunk, plus enough of the previous one to
+            # catch a delimiter split across the boundary
+            end = head.find(b'\n---', max(3, len(head) - len(chunk) - 3))
+        
+        if end == -1:
             frontmatter = {}
-            body = content
-    else:
-        frontmatter = {}
-        body = content
+            body = _decode_text(head + f.read())
+        else:
+            frontmatter = parse_yaml_frontmatter(_decode_text(head[3:end]))
+            body = _decode_text(head[end + 4:] + f.read()).strip()
     
     return {
         'frontmatter': frontmatter,
-        'body': body,
-        'full_content': content
+        'body': body
     }
 
 def convert_skill_to_power(skill_dir: Path, output_dir: Path, dry_run: bool = False) -> bool:
@@ -2,13 +2,31 @@
 """Validate all agents are loaded correctly by scanning the agents directory."""
 
 import json
+import os
 import sys
 import argparse
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, List
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib parser
+    orjson = None
+
+# Top-level fields accepted in a Kiro agent definition
+_ALLOWED_FIELDS = frozenset({
+    '$schema', 'name', 'description', 'prompt', 'mcpServers', 'tools', 
+    'toolAliases', 'allowedTools', 'resources', 'hooks', 'toolsSettings', 
+    'includeMcpJson', 'useLegacyMcpJson', 'model', 'temperature'
+})
+
+# Seconds to wait for a single `kiro-cli agent validate` run
+KIRO_CLI_TIMEOUT = 30
+
 def check_kiro_installed() -> bool:
     """Check if kiro-cli is installed and available."""
     return shutil.which("kiro-cli") is not None
@@ -19,8 +37,12 @@ def validate_agent_file(file_path: Path, use_kiro_cli: bool = False) -> List[str
     
     # 1. Static JSON validation
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
     except json.JSONDecodeError as e:
         return [f"Invalid JSON: {e}"]
     except Exception as e:
@@ -38,13 +60,7 @@ def validate_agent_file(file_path: Path, use_kiro_cli: bool = False) -> List[str
     if 'prompt' in data and not isinstance(data['prompt'], str):
         errors.append("Field 'prompt' must be a string")
 
-    allowed_fields = {
-        '$schema', 'name', 'description', 'prompt', 'mcpServers', 'tools', 
-        'toolAliases', 'allowedTools', 'resources', 'hooks', 'toolsSettings', 
-        'includeMcpJson', 'useLegacyMcpJson', 'model', 'temperature'
-    }
-    
-    unknown_fields = set(data.keys()) - allowed_fields
+    unknown_fields = [field for field in data if field not in _ALLOWED_FIELDS]
     if unknown_fields:
         errors.append(f"Unknown fields found: {', '.join(unknown_fields)}")
 
@@ -54,7 +70,8 @@ def validate_agent_file(file_path: Path, use_kiro_cli: bool = False) -> List[str
             result = subprocess.run(
                 ["kiro-cli", "agent", "validate", "--path", str(file_path)],
                 capture_output=True,
-                text=True
+                text=True,
+                timeout=KIRO_CLI_TIMEOUT
             )
             
             if result.returncode != 0:
@@ -109,12 +126,14 @@ def main():
     valid_count = 0
     invalid_count = 0
     
-    for file_path in json_files:
-        if file_path.name == "INDEX.json":
-            continue
-            
-        errors = validate_agent_file(file_path, use_kiro_cli=use_cli)
-        
+    agent_files = [f for f in json_files if f.name != "INDEX.json"]
+    
+    # kiro-cli validates one path per process, so run those processes
+    # concurrently; threads are enough since each one just waits on a child
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(partial(validate_agent_file, use_kiro_cli=use_cli), agent_files))
+    
+    for file_path, errors in zip(agent_files, results):
         if not errors:
             print(f"✓ {file_path.name}")
             valid_count += 1